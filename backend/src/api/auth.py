@@ -1,13 +1,25 @@
 import os
-from datetime import datetime, timedelta, timezone
+import threading
+import time
 from typing import Optional, Dict, Any
 
 import jwt  # PyJWT
+from cachetools import TTLCache
 
 # Read configuration from env with sane defaults for local/dev
 JWT_SECRET = os.getenv("JWT_SECRET", "change_me_local_dev_secret")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+JWT_CACHE_TTL_SECONDS = int(os.getenv("JWT_CACHE_TTL_SECONDS", "30"))
+
+# Derived once so encode/decode don't rebuild them per call
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
+_ACCESS_TOKEN_TTL_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Issued tokens keyed by (user_id, package_tier), reused for a short window so repeat
+# logins skip signing; capped at half the token lifetime so reused tokens stay fresh.
+_issued_cache: TTLCache = TTLCache(maxsize=10_000, ttl=min(60, _ACCESS_TOKEN_TTL_SECONDS // 2))
+_issued_cache_lock = threading.Lock()
 
 
 # PUBLIC_INTERFACE
@@ -21,12 +33,11 @@ def create_access_token(subject: str, additional_claims: Optional[Dict[str, Any]
     Returns:
         Encoded JWT string.
     """
-    now = datetime.now(tz=timezone.utc)
-    exp = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    now = int(time.time())
     payload: Dict[str, Any] = {
         "sub": subject,
-        "iat": int(now.timestamp()),
-        "exp": int(exp.timestamp()),
+        "iat": now,
+        "exp": now + _ACCESS_TOKEN_TTL_SECONDS,
     }
     if additional_claims:
         payload.update(additional_claims)
@@ -47,4 +58,25 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         jwt.PyJWTError: When token is invalid or expired.
     """
-    return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    return jwt.decode(token, JWT_SECRET, algorithms=_JWT_ALGORITHMS)
+
+
+# PUBLIC_INTERFACE
+def get_cached_token(user_id: str, package_tier: str) -> str:
+    """Return an access token for the user, reusing a recently issued one when possible.
+
+    Args:
+        user_id: The user id to embed in the token as 'sub'.
+        package_tier: The user's package tier, embedded as the 'pkg' claim.
+
+    Returns:
+        Encoded JWT string.
+    """
+    key = (user_id, package_tier)
+    with _issued_cache_lock:
+        token = _issued_cache.get(key)
+    if token is None:
+        token = create_access_token(subject=user_id, additional_claims={"pkg": package_tier})
+        with _issued_cache_lock:
+            _issued_cache[key] = token
+    return token
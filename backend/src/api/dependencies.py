@@ -1,17 +1,55 @@
+import hashlib
+import threading
+import time
 from typing import Annotated
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
-from .auth import decode_token
+from .auth import JWT_CACHE_TTL_SECONDS, decode_token
 from .storage import db
 from .models import UserPublic, PackageTier
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login/form")
+
+# Resolved users keyed by SHA-256 of the token (never the raw token) -> (user, exp), so
+# repeat requests with the same bearer token skip JWT verification and the store lookup
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=JWT_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+# user_id -> token keys cached for that user, so invalidation only touches that user's entries
+_keys_by_user: dict[str, set[bytes]] = {}
+
+
+def _index_token_key(user_id: str, key: bytes) -> None:
+    """Record key under user_id; caller must hold _user_cache_lock."""
+    keys = _keys_by_user.get(user_id)
+    if keys is None:
+        if len(_keys_by_user) >= 2 * _user_cache.maxsize:
+            # Forget users whose cached tokens have all expired or been evicted;
+            # the threshold keeps this sweep amortized O(1) per insert.
+            for uid in list(_keys_by_user):
+                live = {k for k in _keys_by_user[uid] if k in _user_cache}
+                if live:
+                    _keys_by_user[uid] = live
+                else:
+                    del _keys_by_user[uid]
+        keys = _keys_by_user[user_id] = set()
+    else:
+        keys.difference_update([k for k in keys if k not in _user_cache])
+    keys.add(key)
 
 
 # PUBLIC_INTERFACE
-def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserPublic:
+def invalidate_user_cache(user_id: str) -> None:
+    """Drop cached token resolutions for a user, e.g. after their plan changes."""
+    with _user_cache_lock:
+        for key in _keys_by_user.pop(user_id, ()):
+            _user_cache.pop(key, None)
+
+
+# PUBLIC_INTERFACE
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserPublic:
     """Resolve and return the current authenticated user based on Bearer token.
 
     Args:
@@ -23,6 +61,12 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserPubli
     Raises:
         HTTPException: 401 if token invalid/expired or user not found.
     """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    with _user_cache_lock:
+        cached = _user_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
     try:
         claims = decode_token(token)
         user_id = claims.get("sub")
@@ -31,7 +75,8 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserPubli
         record = db.get_user_by_id(user_id)
         if not record:
             raise ValueError("user not found")
-        return UserPublic(
+        # Trusted data from our own store, so skip re-validation
+        user = UserPublic.model_construct(
             id=record["id"],
             email=record["email"],
             package_tier=PackageTier(record["package_tier"]),
@@ -42,3 +87,8 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> UserPubli
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if "exp" in claims:
+        with _user_cache_lock:
+            _user_cache[key] = (user, claims["exp"])
+            _index_token_key(user.id, key)
+    return user
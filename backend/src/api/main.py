@@ -1,8 +1,14 @@
 import os
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+
+from src.api.rate_limit import limiter
 
 from src.api.routers import auth as auth_router
 from src.api.routers import dashboard as dashboard_router
@@ -25,19 +31,28 @@ app = FastAPI(
     ),
     version="1.0.0",
     openapi_tags=openapi_tags,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS configuration from env
-cors_origins_env = os.getenv("CORS_ORIGINS", "*")
-allow_origins: List[str]
-if cors_origins_env.strip() == "*":
-    allow_origins = ["*"]
-else:
-    allow_origins = [o.strip() for o in cors_origins_env.split(",") if o.strip()]
+# Rate limiting for the auth endpoints
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+
+@lru_cache(maxsize=1)
+def _parse_cors_origins() -> FrozenSet[str]:
+    """Parse CORS_ORIGINS (comma separated, or '*') from env."""
+    cors_origins_env = os.getenv("CORS_ORIGINS", "*")
+    if cors_origins_env.strip() == "*":
+        return frozenset(("*",))
+    return frozenset(o.strip() for o in cors_origins_env.split(",") if o.strip())
+
 
+# CORS configuration from env. The middleware stays even for '*' since it emits the
+# Access-Control-* headers; a frozenset makes its per-request origin check O(1).
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allow_origins,
+    allow_origins=_parse_cors_origins(),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -46,7 +61,7 @@ app.add_middleware(
 
 # PUBLIC_INTERFACE
 @app.get("/", tags=["Dashboard"], summary="Health check")
-def health_check():
+async def health_check():
     """Simple health check endpoint."""
     return {"message": "Healthy"}
 
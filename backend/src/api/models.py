@@ -1,6 +1,12 @@
 from enum import Enum
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field
+from typing import Annotated, Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Syntactic email check run by pydantic-core's regex engine (no email-validator call per request)
+EmailAddress = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, to_lower=True, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+]
 
 
 class PackageTier(str, Enum):
@@ -12,14 +18,15 @@ class PackageTier(str, Enum):
 
 class UserPublic(BaseModel):
     """Public-facing user model returned by APIs."""
+    model_config = ConfigDict(frozen=True)
     id: str = Field(..., description="Unique user identifier")
-    email: EmailStr = Field(..., description="User email")
+    email: EmailAddress = Field(..., description="User email")
     package_tier: PackageTier = Field(..., description="User's subscription package")
 
 
 class SignupRequest(BaseModel):
     """Signup input payload."""
-    email: EmailStr = Field(..., description="Email for account signup")
+    email: EmailAddress = Field(..., description="Email for account signup")
     password: str = Field(..., min_length=6, description="Password (min 6 chars)")
     package_tier: Optional[PackageTier] = Field(
         None,
@@ -29,7 +36,7 @@ class SignupRequest(BaseModel):
 
 class LoginRequest(BaseModel):
     """Login input payload."""
-    email: EmailStr = Field(..., description="Email for account login")
+    email: EmailAddress = Field(..., description="Email for account login")
     password: str = Field(..., description="User password")
 
 
@@ -41,6 +48,7 @@ class TokenResponse(BaseModel):
 
 class DashboardFeature(BaseModel):
     """Feature descriptor for dashboard."""
+    model_config = ConfigDict(frozen=True)
     key: str = Field(..., description="Feature key")
     label: str = Field(..., description="Human-readable label")
     enabled: bool = Field(..., description="Whether the feature is enabled by package")
@@ -55,6 +63,7 @@ class DashboardResponse(BaseModel):
 
 class TailoredContentResponse(BaseModel):
     """Response model for tailored content based on package tier."""
+    model_config = ConfigDict(frozen=True)
     summary: str = Field(..., description="Short description of content scope based on package")
     data_basic: List[str] = Field(..., description="Data available to all users")
     data_pro: Optional[List[str]] = Field(None, description="Additional data for pro and above")
@@ -65,6 +74,7 @@ class TailoredContentResponse(BaseModel):
 # PUBLIC_INTERFACE
 class PlanInfo(BaseModel):
     """Minimal representation of a user's plan/package."""
+    model_config = ConfigDict(frozen=True)
     package_tier: PackageTier = Field(..., description="The current subscription package tier")
 
 
@@ -0,0 +1,12 @@
+import os
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+# Per-client-IP limit for the unauthenticated endpoints that run password hashing
+AUTH_RATE_LIMIT = os.getenv("AUTH_RATE_LIMIT", "5/minute")
+
+# Keyed on the immediate peer address. Behind a reverse proxy, run uvicorn with --proxy-headers and
+# --forwarded-allow-ips set to the proxy's address, otherwise every client shares the proxy's bucket.
+# In-process counters; point storage_uri at Redis when running multiple workers
+limiter = Limiter(key_func=get_remote_address)
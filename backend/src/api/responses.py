@@ -0,0 +1,40 @@
+import hashlib
+
+from fastapi import Request, Response, status
+
+# Let clients keep a private copy but revalidate it on every use, so a plan change is
+# visible immediately while unchanged responses cost only an empty 304.
+CACHE_CONTROL = "private, no-cache"
+
+
+# PUBLIC_INTERFACE
+def etag_for(content: bytes) -> str:
+    """Return a strong ETag derived from the response body."""
+    return f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# PUBLIC_INTERFACE
+def cached_json_response(request: Request, content: bytes, etag: str) -> Response:
+    """Return pre-serialized JSON with cache validators.
+
+    Args:
+        request: Incoming request, checked for an If-None-Match header.
+        content: Serialized JSON body.
+        etag: ETag for content, typically from etag_for().
+
+    Returns:
+        Response: 304 without a body when the client's copy is current, else 200 with content.
+    """
+    headers = {"Cache-Control": CACHE_CONTROL, "ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
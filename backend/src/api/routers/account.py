@@ -1,11 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import get_current_user, invalidate_user_cache
 from src.api.models import UserPublic, PackageTier, PlanInfo, PlanUpdateRequest
+from src.api.responses import cached_json_response, etag_for
 from src.api.storage import db
 
 router = APIRouter(prefix="/account", tags=["Account"])
 
+# Plan payloads depend only on the tier, so serialize them once at import
+_PLAN_JSON_BY_TIER: dict[PackageTier, bytes] = {
+    tier: PlanInfo(package_tier=tier).model_dump_json().encode("utf-8") for tier in PackageTier
+}
+_PLAN_ETAG_BY_TIER: dict[PackageTier, str] = {tier: etag_for(content) for tier, content in _PLAN_JSON_BY_TIER.items()}
+# Stored records hold the tier's string value; map it back without constructing the enum
+_TIER_BY_VALUE: dict[str, PackageTier] = {tier.value: tier for tier in PackageTier}
+
 
 # PUBLIC_INTERFACE
 @router.get(
@@ -15,12 +24,14 @@ router = APIRouter(prefix="/account", tags=["Account"])
     description="Returns the authenticated user's current subscription package tier.",
     responses={
         200: {"description": "Current plan retrieved"},
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
         401: {"description": "Unauthorized"},
     },
 )
-def get_plan(user: UserPublic = Depends(get_current_user)) -> PlanInfo:
+async def get_plan(request: Request, user: UserPublic = Depends(get_current_user)) -> Response:
     """Return the current authenticated user's package tier."""
-    return PlanInfo(package_tier=user.package_tier)
+    tier = user.package_tier
+    return cached_json_response(request, _PLAN_JSON_BY_TIER[tier], _PLAN_ETAG_BY_TIER[tier])
 
 
 # PUBLIC_INTERFACE
@@ -38,10 +49,14 @@ def get_plan(user: UserPublic = Depends(get_current_user)) -> PlanInfo:
         401: {"description": "Unauthorized"},
     },
 )
-def update_plan(payload: PlanUpdateRequest, user: UserPublic = Depends(get_current_user)) -> PlanInfo:
+async def update_plan(payload: PlanUpdateRequest, user: UserPublic = Depends(get_current_user)) -> Response:
     """Update the current user's package tier and return the updated plan."""
     updated = db.set_package(user_id=user.id, package_tier=payload.package_tier)
     if not updated:
         # This should not occur under normal conditions since the user comes from a verified token
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return PlanInfo(package_tier=PackageTier(updated["package_tier"]))
+    invalidate_user_cache(user.id)
+    return Response(
+        content=_PLAN_JSON_BY_TIER[_TIER_BY_VALUE[updated["package_tier"]]],
+        media_type="application/json",
+    )
@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException, status, Form
+from fastapi import APIRouter, HTTPException, Request, Response, status, Form
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from src.api.models import SignupRequest, LoginRequest, TokenResponse, PackageTier
 from src.api.storage import db
-from src.api.auth import create_access_token
+from src.api.auth import get_cached_token
+from src.api.rate_limit import AUTH_RATE_LIMIT, limiter
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -16,10 +21,12 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
     responses={
         201: {"description": "User created; token issued"},
         400: {"description": "Email already exists"},
+        429: {"description": "Too many requests"},
     },
     status_code=201,
 )
-def signup(payload: SignupRequest) -> TokenResponse:
+@limiter.limit(AUTH_RATE_LIMIT)
+def signup(request: Request, payload: SignupRequest) -> Response:
     """Register a new user and return an access token."""
     existing = db.get_user_by_email(payload.email)
     if existing:
@@ -28,8 +35,61 @@ def signup(payload: SignupRequest) -> TokenResponse:
     tier = payload.package_tier or PackageTier.free
     record = db.create_user(email=str(payload.email), password=payload.password, package_tier=tier)
 
-    token = create_access_token(subject=record["id"], additional_claims={"pkg": record["package_tier"]})
-    return TokenResponse(access_token=token, token_type="bearer")
+    token = get_cached_token(record["id"], record["package_tier"])
+    # Returned as a Response so FastAPI skips re-validating it against response_model
+    return ORJSONResponse(
+        content={"access_token": token, "token_type": "bearer"},
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+def _login_response(email: str, password: str) -> Response:
+    record = db.verify_password(email=email, password=password)
+    if not record:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+
+    token = get_cached_token(record["id"], record["package_tier"])
+    return ORJSONResponse(content={"access_token": token, "token_type": "bearer"})
+
+
+_LOGIN_FORM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "username": {
+            "type": "string",
+            "description": "Alias used by OAuth2PasswordRequestForm; treated as the email.",
+        },
+        "email": {
+            "type": "string",
+            "description": "Email for account login when using form-encoded payloads (alias of 'username').",
+        },
+        "password": {
+            "type": "string",
+            "description": "Password for account login when using form-encoded payloads.",
+        },
+    },
+    "required": ["password"],
+}
+
+
+async def _login_credentials(request: Request) -> tuple[str, str]:
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        try:
+            payload = LoginRequest.model_validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError(exc.errors(include_url=False)) from None
+        return payload.email, payload.password
+
+    form = await request.form()
+    email = form.get("email") or form.get("username")
+    password = form.get("password")
+    if not isinstance(email, str) or not isinstance(password, str) or not email or not password:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="email/username and password are required",
+        )
+    return email, password
 
 
 # PUBLIC_INTERFACE
@@ -37,64 +97,53 @@ def signup(payload: SignupRequest) -> TokenResponse:
     "/login",
     response_model=TokenResponse,
     summary="Login and issue token",
-    description="Authenticates a user with email/password and returns a JWT access token.",
+    description=(
+        "Authenticates a user and returns a JWT access token. Accepts a JSON email/password payload, "
+        "or form-encoded 'username' (or 'email') and 'password'."
+    ),
     responses={
         200: {"description": "Authenticated; token issued"},
         401: {"description": "Invalid credentials"},
+        429: {"description": "Too many requests"},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": LoginRequest.model_json_schema()},
+                "application/x-www-form-urlencoded": {"schema": _LOGIN_FORM_SCHEMA},
+            },
+        },
     },
 )
-def login(
-    payload: LoginRequest | None = None,
-    email: str | None = Form(
-        default=None,
-        description="Email for account login when using form-encoded payloads (alias of 'username').",
-    ),
-    password: str | None = Form(
-        default=None,
-        description="Password for account login when using form-encoded payloads.",
-    ),
-    username: str | None = Form(
-        default=None,
-        description="Alias used by OAuth2PasswordRequestForm; treated as the email.",
-    ),
-) -> TokenResponse:
-    """Authenticate an existing user and return an access token.
-
-    Supports both application/json (LoginRequest) and application/x-www-form-urlencoded
-    with fields 'email' or 'username' and 'password'. This improves compatibility with
-    various frontend/client implementations that may post form data instead of JSON.
-    """
-    # Determine credentials source: JSON payload or form fields
-    json_email = str(payload.email) if payload and getattr(payload, "email", None) else None
-    json_password = payload.password if payload and getattr(payload, "password", None) else None
+@limiter.shared_limit(AUTH_RATE_LIMIT, scope="login")
+async def login(request: Request) -> Response:
+    """Authenticate an existing user from a JSON or form payload and return an access token."""
+    email, password = await _login_credentials(request)
+    # Password hashing is CPU-bound; keep it off the event loop
+    return await run_in_threadpool(_login_response, email, password)
 
-    form_email = email or username
-    form_password = password
 
-    final_email = json_email or form_email
-    final_password = json_password or form_password
-
-    if not final_email or not final_password:
-        # Let FastAPI return 422 for missing fields or provide a clear error
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="email/username and password are required",
-        )
-
-    record = db.verify_password(email=str(final_email), password=final_password)
-    if not record:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
-
-    token = create_access_token(subject=record["id"], additional_claims={"pkg": record["package_tier"]})
-    return TokenResponse(access_token=token, token_type="bearer")
-
-
-# Add a trailing-slash alias for clients that may post to '/auth/login/'
-router.add_api_route(
-    "/login/",
-    login,
-    methods=["POST"],
-    include_in_schema=False,
-    summary="Login and issue token (alias with trailing slash)",
-    description="Alias for /auth/login to improve client compatibility.",
+# PUBLIC_INTERFACE
+@router.post(
+    "/login/form",
+    response_model=TokenResponse,
+    summary="Login with form data and issue token",
+    description=(
+        "Authenticates a user with form-encoded 'username' (the email) and 'password', "
+        "as sent by OAuth2 password-flow clients, and returns a JWT access token."
+    ),
+    responses={
+        200: {"description": "Authenticated; token issued"},
+        401: {"description": "Invalid credentials"},
+        429: {"description": "Too many requests"},
+    },
 )
+@limiter.shared_limit(AUTH_RATE_LIMIT, scope="login")
+def login_form(
+    request: Request,
+    username: str = Form(..., description="Account email (OAuth2PasswordRequestForm field name)."),
+    password: str = Form(..., description="User password."),
+) -> Response:
+    """Authenticate an existing user from form fields and return an access token."""
+    return _login_response(username, password)
@@ -1,17 +1,22 @@
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import TypeAdapter
 
 from src.api.dependencies import get_current_user
 from src.api.models import DashboardResponse, DashboardFeature, UserPublic, PackageTier
+from src.api.responses import cached_json_response, etag_for
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
+_PRO_PLUS_TIERS = frozenset((PackageTier.pro, PackageTier.enterprise))
+
 
 def _features_for(tier: PackageTier) -> list[DashboardFeature]:
     base = [
         DashboardFeature(key="basic_data", label="Basic Data", enabled=True),
         DashboardFeature(key="support", label="Community Support", enabled=True),
     ]
-    if tier in (PackageTier.pro, PackageTier.enterprise):
+    if tier in _PRO_PLUS_TIERS:
         base.append(DashboardFeature(key="pro_data", label="Pro Data", enabled=True, limit=10000))
         base.append(DashboardFeature(key="priority_support", label="Priority Support", enabled=True))
     if tier is PackageTier.enterprise:
@@ -21,13 +26,29 @@ def _features_for(tier: PackageTier) -> list[DashboardFeature]:
     return base
 
 
+# Feature lists depend only on the tier, so serialize them once at import
+_features_adapter = TypeAdapter(list[DashboardFeature])
+_FEATURES_JSON_BY_TIER: dict[PackageTier, bytes] = {
+    tier: _features_adapter.dump_json(_features_for(tier)) for tier in PackageTier
+}
+
+
 # PUBLIC_INTERFACE
 @router.get(
     "/me",
     response_model=DashboardResponse,
     summary="Get dashboard info",
     description="Returns the authenticated user's profile and features enabled by their package tier.",
+    responses={
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
+    },
 )
-def me(user: UserPublic = Depends(get_current_user)) -> DashboardResponse:
+async def me(request: Request, user: UserPublic = Depends(get_current_user)) -> Response:
     """Return user profile and feature entitlements for their package tier."""
-    return DashboardResponse(user=user, features=_features_for(user.package_tier))
+    # Splice the per-user profile into the pre-serialized features; matches DashboardResponse
+    profile = {"id": user.id, "email": user.email, "package_tier": user.package_tier}
+    content = b'{"user":%s,"features":%s}' % (
+        orjson.dumps(profile),
+        _FEATURES_JSON_BY_TIER[user.package_tier],
+    )
+    return cached_json_response(request, content, etag_for(content))
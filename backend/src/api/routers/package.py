@@ -1,27 +1,20 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 from src.api.dependencies import get_current_user
 from src.api.models import TailoredContentResponse, UserPublic, PackageTier
+from src.api.responses import cached_json_response, etag_for
 
 router = APIRouter(prefix="/api", tags=["Tailored API"])
 
 
-# PUBLIC_INTERFACE
-@router.get(
-    "/content",
-    response_model=TailoredContentResponse,
-    summary="Get tailored content",
-    description="Returns content whose fields and richness depend on the requesting user's package tier.",
-)
-def get_content(user: UserPublic = Depends(get_current_user)) -> TailoredContentResponse:
-    """Return content shaped according to the user's package tier."""
+def _content_for(tier: PackageTier) -> TailoredContentResponse:
     basic = ["item-a", "item-b", "item-c"]
-    if user.package_tier == PackageTier.free:
+    if tier == PackageTier.free:
         return TailoredContentResponse(
             summary="Basic content for Free tier",
             data_basic=basic,
         )
-    if user.package_tier == PackageTier.pro:
+    if tier == PackageTier.pro:
         return TailoredContentResponse(
             summary="Expanded content for Pro tier",
             data_basic=basic,
@@ -35,3 +28,28 @@ def get_content(user: UserPublic = Depends(get_current_user)) -> TailoredContent
         data_enterprise=["ent-1", "ent-2", "ent-3"],
         analytics={"insights": {"score": 92, "segments": ["alpha", "beta"]}},
     )
+
+
+# Content depends only on the tier, so serialize each response once at import
+_CONTENT_JSON_BY_TIER: dict[PackageTier, bytes] = {
+    tier: _content_for(tier).model_dump_json().encode("utf-8") for tier in PackageTier
+}
+_CONTENT_ETAG_BY_TIER: dict[PackageTier, str] = {
+    tier: etag_for(content) for tier, content in _CONTENT_JSON_BY_TIER.items()
+}
+
+
+# PUBLIC_INTERFACE
+@router.get(
+    "/content",
+    response_model=TailoredContentResponse,
+    summary="Get tailored content",
+    description="Returns content whose fields and richness depend on the requesting user's package tier.",
+    responses={
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
+    },
+)
+async def get_content(request: Request, user: UserPublic = Depends(get_current_user)) -> Response:
+    """Return content shaped according to the user's package tier."""
+    tier = user.package_tier
+    return cached_json_response(request, _CONTENT_JSON_BY_TIER[tier], _CONTENT_ETAG_BY_TIER[tier])
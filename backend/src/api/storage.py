@@ -1,9 +1,12 @@
 import os
-import uuid
+import secrets
 import hmac
 import hashlib
+import threading
 from typing import Optional, Dict, Any
 
+from cachetools import TTLCache
+
 from .models import PackageTier
 
 
@@ -12,43 +15,63 @@ class InMemoryDB:
     def __init__(self) -> None:
         # user_id -> user_record
         self.users: Dict[str, Dict[str, Any]] = {}
-        # email -> user_id
-        self.email_index: Dict[str, str] = {}
+        # normalized email -> user_record (same dict object as in users)
+        self.email_index: Dict[str, Dict[str, Any]] = {}
+        # keyed HMAC of (email, password) -> user_id for recently verified logins;
+        # the per-process key keeps entries useless for offline password guessing
+        self._verify_key = os.urandom(32)
+        self._verify_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+        self._verify_lock = threading.Lock()
 
     def create_user(self, email: str, password: str, package_tier: PackageTier) -> Dict[str, Any]:
         """Create a user with salted hash credentials."""
-        user_id = str(uuid.uuid4())
+        email = normalize_email(email)
+        user_id = secrets.token_urlsafe(16)
         salt = os.urandom(16)
         password_hash = _hash_password(password, salt)
         record = {
             "id": user_id,
-            "email": email.lower(),
-            "salt_hex": salt.hex(),
+            "email": email,
+            "salt": salt,
             "password_hash": password_hash,
             "package_tier": package_tier.value,
         }
         self.users[user_id] = record
-        self.email_index[email.lower()] = user_id
+        self.email_index[email] = record
         return record
 
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        user_id = self.email_index.get(email.lower())
-        if not user_id:
-            return None
-        return self.users.get(user_id)
+        return self.email_index.get(normalize_email(email))
 
     def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         return self.users.get(user_id)
 
+    def _verify_cache_key(self, email: str, password: str) -> bytes:
+        # Length-prefix the email so no (email, password) pair can collide with another
+        email_bytes = email.encode("utf-8")
+        mac = hmac.new(self._verify_key, digestmod=hashlib.sha256)
+        mac.update(len(email_bytes).to_bytes(4, "big"))
+        mac.update(email_bytes)
+        mac.update(password.encode("utf-8"))
+        return mac.digest()
+
     def verify_password(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """Verify password for email; returns user record if valid."""
-        u = self.get_user_by_email(email)
+        email = normalize_email(email)
+        cache_key = self._verify_cache_key(email, password)
+        with self._verify_lock:
+            cached_user_id = self._verify_cache.get(cache_key)
+        if cached_user_id is not None:
+            return self.users.get(cached_user_id)
+
+        u = self.email_index.get(email)
         if not u:
             return None
-        salt = bytes.fromhex(u["salt_hex"])
         expected_hash = u["password_hash"]
-        candidate_hash = _hash_password(password, salt)
+        candidate_hash = _hash_password(password, u["salt"])
         if hmac.compare_digest(expected_hash, candidate_hash):
+            with self._verify_lock:
+                self._verify_cache[cache_key] = u["id"]
             return u
         return None
 
@@ -60,10 +83,16 @@ class InMemoryDB:
         return u
 
 
-def _hash_password(password: str, salt: bytes) -> str:
-    """Hash a password with PBKDF2-HMAC-SHA256 and return hex digest."""
-    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100_000, dklen=32)
-    return dk.hex()
+# PUBLIC_INTERFACE
+def normalize_email(email: str) -> str:
+    """Return the canonical form of an email used as the lookup key."""
+    return email.strip().lower()
+
+
+def _hash_password(password: str, salt: bytes) -> bytes:
+    """Hash a password with scrypt and return the raw 32-byte digest."""
+    # n=2**13, r=8 costs 8 MiB and roughly half the CPU time of the previous 100k-round PBKDF2
+    return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=2**13, r=8, p=1, dklen=32)
 
 
 # Singleton storage for app lifetime
@@ -0,0 +1,34 @@
+import os
+import uuid
+
+import pytest
+
+# Must be set before the app is imported; the limiter reads it at import time
+os.environ.setdefault("AUTH_RATE_LIMIT", "1000/minute")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.api.main import app  # noqa: E402
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture
+def signup(client: TestClient):
+    """Create a fresh user and return (user_id, access_token)."""
+
+    def _signup(package_tier: str = "free") -> tuple[str, str]:
+        email = f"{uuid.uuid4().hex}@example.com"
+        response = client.post(
+            "/auth/signup",
+            json={"email": email, "password": "secret1", "package_tier": package_tier},
+        )
+        assert response.status_code == 201, response.text
+        token = response.json()["access_token"]
+        user = client.get("/dashboard/me", headers={"Authorization": f"Bearer {token}"}).json()["user"]
+        return user["id"], token
+
+    return _signup
@@ -0,0 +1,42 @@
+import time
+
+from src.api.auth import create_access_token
+from src.api.dependencies import _keys_by_user
+
+
+def _auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_plan_change_invalidates_other_cached_tokens(client, signup):
+    user_id, token = signup("free")
+    other_token = create_access_token(user_id, {"jti": "second-session"})
+    assert other_token != token
+
+    # Warm the cache for both tokens
+    assert client.get("/account/plan", headers=_auth(token)).json() == {"package_tier": "free"}
+    assert client.get("/account/plan", headers=_auth(other_token)).json() == {"package_tier": "free"}
+    assert len(_keys_by_user[user_id]) == 2
+
+    response = client.put("/account/plan", json={"package_tier": "pro"}, headers=_auth(token))
+    assert response.status_code == 200
+    assert user_id not in _keys_by_user
+
+    assert client.get("/account/plan", headers=_auth(other_token)).json() == {"package_tier": "pro"}
+
+
+def test_expired_token_rejected_on_cache_hit(client, signup):
+    user_id, _ = signup()
+    token = create_access_token(user_id, {"exp": int(time.time()) + 1})
+
+    assert client.get("/dashboard/me", headers=_auth(token)).status_code == 200
+
+    time.sleep(2)
+    response = client.get("/dashboard/me", headers=_auth(token))
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_invalid_token_rejected(client):
+    response = client.get("/dashboard/me", headers=_auth("not-a-jwt"))
+    assert response.status_code == 401
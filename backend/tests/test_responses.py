@@ -0,0 +1,42 @@
+import pytest
+
+
+def _auth(token: str, **headers: str) -> dict:
+    return {"Authorization": f"Bearer {token}", **headers}
+
+
+@pytest.mark.parametrize("path", ["/account/plan", "/dashboard/me", "/api/content"])
+def test_etag_round_trip(client, signup, path):
+    _, token = signup()
+
+    response = client.get(path, headers=_auth(token))
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    not_modified = client.get(path, headers=_auth(token, **{"If-None-Match": etag}))
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("if_none_match", ["*", 'W/{etag}', '"stale", {etag}'])
+def test_if_none_match_forms(client, signup, if_none_match):
+    _, token = signup()
+    etag = client.get("/account/plan", headers=_auth(token)).headers["etag"]
+
+    header = if_none_match.format(etag=etag)
+    response = client.get("/account/plan", headers=_auth(token, **{"If-None-Match": header}))
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("path", ["/account/plan", "/dashboard/me"])
+def test_etag_changes_after_plan_change(client, signup, path):
+    _, token = signup("free")
+    etag = client.get(path, headers=_auth(token)).headers["etag"]
+
+    assert client.put("/account/plan", json={"package_tier": "enterprise"}, headers=_auth(token)).status_code == 200
+
+    response = client.get(path, headers=_auth(token, **{"If-None-Match": etag}))
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
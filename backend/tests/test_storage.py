@@ -0,0 +1,13 @@
+from src.api.models import PackageTier
+from src.api.storage import InMemoryDB
+
+
+def test_verify_password_caches_only_exact_credentials():
+    db = InMemoryDB()
+    record = db.create_user(email="a@example.com", password="p\0q", package_tier=PackageTier.free)
+
+    assert db.verify_password("a@example.com", "p\0q") is record
+    # Same bytes when email and password are joined with a separator; must not hit the cache
+    assert db.verify_password("a@example.com\0p", "q") is None
+    assert db.verify_password("a@example.com", "wrong") is None
+    assert db.verify_password("A@Example.com ", "p\0q") is record